@@ -1,5 +1,6 @@
 import os
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+from dotenv import dotenv_values, find_dotenv
 
 """
 Environment Variables Configuration Module
@@ -13,19 +14,34 @@ The EnvConfig class offers:
 - Multiple access patterns (property, attribute, and dictionary-like)
 - Validation and error handling
 - Convenience properties for common credentials
+- Caching of looked-up values, so repeated access does not hit os.environ
+- The Spotify credentials snapshotted at load time as plain attributes
 
 Usage:
-    config = EnvConfig()
+    config = get_config()  # Shared instance, created on first use
     client_id = config.spotify_client_id  # Property access
     secret = config["SPOTIFY_CLIENT_SECRET"]  # Dictionary-like access
     uri = config.SPOTIFY_REDIRECT_URI  # Attribute access
     
+The .env file is parsed once per process and only re-read when its modification
+time changes; variables it set earlier then take their edited values. As with
+python-dotenv, variables already set in the environment are never overridden.
+Set MTM_SKIP_DOTENV=1 to skip it entirely when the variables are
+already exported (e.g. in production).
+
 Required environment variables:
 - SPOTIFY_CLIENT_ID: Your Spotify application's client ID
 - SPOTIFY_CLIENT_SECRET: Your Spotify application's client secret
 - SPOTIFY_REDIRECT_URI: The URI to redirect to after authentication (http://127.0.0.1:8888/callback)
 """
 
+# Bound once so lookups skip the os.getenv wrapper and the attribute chain
+_environ_get = os.environ.get
+
+# (path, mtime, names of the variables it set) of the .env file last loaded,
+# shared by all EnvConfig instances
+_loaded_env = None
+
 class EnvConfig:
     """
     A configuration class for managing environment variables.
@@ -33,6 +49,9 @@ class EnvConfig:
     This class loads environment variables from a .env file and provides
     convenient access to them through properties and dictionary-like access.
     """
+    # Variables read eagerly at load time and stored as plain instance attributes
+    SNAPSHOT_KEYS = ("SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI")
+    
     def __init__(self):
         """
         Initialize the EnvConfig class and load environment variables from .env file.
@@ -40,14 +59,33 @@ class EnvConfig:
         Raises:
             EnvironmentError: If the .env file is not found or cannot be read.
         """
+        self._cache = {}
         load_result = self._load_env()
         if not load_result:
             raise EnvironmentError(".env file not found or unreadable.")
+        self._snapshot()
+
+    def reload(self):
+        """
+        Reload the .env file and drop all cached values.
+        
+        Raises:
+            EnvironmentError: If the .env file is not found or cannot be read.
+        """
+        self._cache.clear()
+        for name in ("spotify_client_id", "spotify_client_secret", "spotify_redirect_uri", *self.SNAPSHOT_KEYS):
+            self.__dict__.pop(name, None)
+        if not self._load_env():
+            raise EnvironmentError(".env file not found or unreadable.")
+        self._snapshot()
 
     def get(self, key, default=None):
         """
         Get an environment variable by key.
         
+        Values found in the environment are cached on first access; call
+        reload() to pick up changes made after that.
+        
         Args:
             key (str): The name of the environment variable.
             default (Any, optional): The default value to return if the variable is not found.
@@ -59,31 +97,78 @@ class EnvConfig:
         Raises:
             KeyError: If the environment variable is not found and no default is provided.
         """
-        value = os.getenv(key, default)
-        if value is None:
+        if key in self._cache:
+            return self._cache[key]
+        value = _environ_get(key)
+        if value is not None:
+            self._cache[key] = value
+            return value
+        if default is None:
             raise KeyError(f"Required environment variable '{key}' not found and no default provided.")
-        return value
+        return default
+
+    def _snapshot(self):
+        """
+        Read the SNAPSHOT_KEYS variables into the cache and onto the instance.
+        
+        Attribute access such as config.SPOTIFY_CLIENT_ID then resolves through
+        the instance dictionary and never reaches __getattr__. Variables that are
+        not set are skipped, so a missing one still raises on access.
+        """
+        for key in self.SNAPSHOT_KEYS:
+            value = _environ_get(key)
+            if value is not None:
+                self._cache[key] = value
+                self.__dict__[key] = value
 
     def _load_env(self):
         """
         Load environment variables from .env file.
         
+        The file is skipped if it has already been loaded and has not changed
+        since, or if MTM_SKIP_DOTENV is set. When an edited file is re-read, the
+        variables it set before are updated to their new values; other
+        variables already in the environment are left alone.
+        
         Returns:
             bool: True if the .env file was loaded successfully, False otherwise.
         """
-        return load_dotenv()
+        global _loaded_env
+        if _environ_get("MTM_SKIP_DOTENV"):
+            return True
+        
+        path = find_dotenv()
+        if not path:
+            return False
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return False
+        if _loaded_env and _loaded_env[:2] == (path, mtime):
+            return True
+        
+        values = {key: value for key, value in dotenv_values(path).items() if value is not None}
+        if not values:
+            return False
+        
+        owned = _loaded_env[2] if _loaded_env and _loaded_env[0] == path else frozenset()
+        applied = frozenset(key for key in values if key in owned or key not in os.environ)
+        for key in applied:
+            os.environ[key] = values[key]
+        _loaded_env = (path, mtime, applied)
+        return True
 
-    @property
+    @cached_property
     def spotify_client_id(self):
         """Get the Spotify client ID from environment variables."""
         return self.get("SPOTIFY_CLIENT_ID")
     
-    @property
+    @cached_property
     def spotify_client_secret(self):
         """Get the Spotify client secret from environment variables."""
         return self.get("SPOTIFY_CLIENT_SECRET")
     
-    @property
+    @cached_property
     def spotify_redirect_uri(self):
         """Get the Spotify redirect URI from environment variables."""
         return self.get("SPOTIFY_REDIRECT_URI")
@@ -104,7 +189,8 @@ class EnvConfig:
         """
         Allow attribute-like access to environment variables.
         
-        This method is called when an attribute is not found through normal attribute lookup.
+        This method is called when an attribute is not found through normal attribute lookup,
+        which for the snapshotted Spotify variables only happens if they are unset.
         It attempts to find an environment variable with the same name.
         
         Args:
@@ -116,12 +202,33 @@ class EnvConfig:
         Raises:
             AttributeError: If the environment variable is not found.
         """
+        # Private names are never environment variables; bailing out early also
+        # avoids recursing through self._cache before __init__ has set it.
+        if key.startswith("_"):
+            raise AttributeError(key)
         try:
             return self.get(key)
         except KeyError as e:
             raise AttributeError(e)
 
+@lru_cache(maxsize=1)
+def get_config():
+    """
+    Get the shared EnvConfig instance, creating it on first use.
+    
+    Deferring construction to the first call means the .env file is not read
+    at import time, and tests can patch this function instead of the module
+    load order.
+    
+    Returns:
+        EnvConfig: The shared configuration object.
+        
+    Raises:
+        EnvironmentError: If the .env file is not found or cannot be read.
+    """
+    return EnvConfig()
+
 # Usage example:
-# from env_variables import EnvConfig
-# config = EnvConfig()
+# from env_variables import get_config
+# config = get_config()
 # api_key = config.spotify_client_id
\ No newline at end of file
@@ -1,19 +1,10 @@
-from bs4 import BeautifulSoup
-import lxml
-import requests
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
-from env_variables import EnvConfig
-from scrapers.billboard import BillboardTop100Scraper
-from scrapers.soundcloud import SoundCloudEDMScraper
-from scrapers.AppleMusic_EDM import AppleMusicEDMScraper
-from scrapers.traxsource_deep_house import TraxsourceDeepHouseScraper
-from playlist_builder import PlaylistBuilder
+from env_variables import get_config
+import logging
+import os
+import re
 import sys
 from datetime import datetime
 
-config = EnvConfig()
-
 """
 Music Time Machine
 
@@ -26,7 +17,9 @@ users through the process of selecting a chart source, specifying parameters,
 and creating a Spotify playlist.
 
 This script serves as the entry point to the application and orchestrates the 
-workflow between user input and the chart scrapers.
+workflow between user input and the chart scrapers. Scrapers and the playlist
+builder are imported inside the flow that needs them, so a run only loads the
+modules (and their HTTP/parsing/Spotify dependencies) for the chosen chart.
 
 Usage:
     python main.py
@@ -35,6 +28,28 @@ Author: John Murphy
 Version: 2.1.0
 """
 
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def configure_logging():
+    """
+    Send log messages to stdout alongside the interactive prompts.
+    
+    Progress from the playlist builder is reported through logging, so the
+    bare message is shown to match the rest of the console output. The level
+    defaults to INFO and can be set with the LOG_LEVEL variable, in the
+    environment or the .env file like the other settings, e.g. LOG_LEVEL=DEBUG
+    for per-track detail or LOG_LEVEL=WARNING for quiet runs.
+    """
+    try:
+        level_name = get_config().get("LOG_LEVEL", "INFO")
+    except EnvironmentError:
+        # No .env file; main() reports that once a chart has been chosen
+        level_name = os.environ.get("LOG_LEVEL", "INFO")
+    level = logging.getLevelName(level_name.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=level, format="%(message)s", stream=sys.stdout)
+
 def display_welcome_message():
     """Display a welcome message with ASCII art."""
     welcome_message = """
@@ -79,11 +94,18 @@ def get_billboard_date():
     """
     while True:
         date_input = input("\nWhich date do you want to travel to? Use the format YYYY-MM-DD: ").strip()
-        # Simple validation - could be enhanced
-        if len(date_input.split('-')) == 3 and len(date_input) == 10:
-            return date_input
-        else:
+        if not _DATE_RE.match(date_input):
             print("Invalid date format. Please use YYYY-MM-DD (e.g., 2000-01-01).")
+            continue
+        
+        # Reject dates that are well-formed but don't exist, like 2024-02-31
+        try:
+            datetime.strptime(date_input, '%Y-%m-%d')
+        except ValueError:
+            print(f"{date_input} is not a valid date. Please enter a real calendar date.")
+            continue
+        
+        return date_input
 
 def get_playlist_name(default_name):
     """
@@ -100,6 +122,9 @@ def get_playlist_name(default_name):
 
 def run_billboard_flow():
     """Run the Billboard Hot 100 workflow."""
+    from scrapers.billboard import BillboardTop100Scraper
+    from playlist_builder import PlaylistBuilder
+    
     # Get the date
     target_date = get_billboard_date()
     
@@ -144,6 +169,9 @@ def run_billboard_flow():
 
 def run_soundcloud_flow():
     """Run the SoundCloud EDM workflow."""
+    from scrapers.soundcloud import SoundCloudEDMScraper
+    from playlist_builder import PlaylistBuilder
+    
     # Create the scraper and scrape the chart
     scraper = SoundCloudEDMScraper()
     success = scraper.scrape()
@@ -187,6 +215,9 @@ def run_soundcloud_flow():
 
 def run_applemusic_flow():
     """Run the Apple Music EDM Hits workflow."""
+    from scrapers.AppleMusic_EDM import AppleMusicEDMScraper
+    from playlist_builder import PlaylistBuilder
+    
     # Create the scraper and scrape the chart
     scraper = AppleMusicEDMScraper()
     success = scraper.scrape()
@@ -229,6 +260,9 @@ def run_applemusic_flow():
 
 def run_traxsource_flow():
     """Run the Traxsource Deep House workflow."""
+    from scrapers.traxsource_deep_house import TraxsourceDeepHouseScraper
+    from playlist_builder import PlaylistBuilder
+    
     # Create the scraper and scrape the chart
     scraper = TraxsourceDeepHouseScraper()
     tracks_data = scraper.scrape()
@@ -274,6 +308,8 @@ def main():
     Main function to run the application flow.
     """
     # Configuration
+    configure_logging()
+    
     try:
         # Display welcome message
         display_welcome_message()
@@ -281,6 +317,9 @@ def main():
         # Get chart choice
         chart_choice = get_chart_choice()
         
+        # Make sure the configuration can be loaded before running a flow
+        get_config()
+        
         # Run appropriate flow based on chart choice
         if chart_choice == 1:
             run_billboard_flow()
@@ -1,6 +1,15 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, repeat
+import requests
 import spotipy
+from requests.adapters import HTTPAdapter
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
-from env_variables import EnvConfig
+from urllib3.util.retry import Retry
+from env_variables import get_config
+from search_cache import MISS_TTL, SearchCache, normalize_key
 
 """
 Playlist Builder Module
@@ -10,8 +19,139 @@ creating Spotify playlists from track data regardless of the source.
 
 By separating playlist creation from data scraping, we maintain a cleaner
 separation of concerns and make the system more maintainable and extensible.
+
+The authenticated Spotify client is created once per process by
+get_spotify_client() and shared by every PlaylistBuilder, so the OAuth
+handshake is not repeated for each playlist or search, and its token is read
+from the token cache file once rather than before every API call. Track
+searches are network-bound, so create_playlist() runs them on a small thread
+pool that shares that client and token. Search results are memoized in a persistent SearchCache,
+so songs seen in earlier runs are not searched for again.
+
+Progress is reported through the logging module rather than print(), so
+messages from the search threads are written whole and can be silenced by
+raising the log level.
 """
 
+logger = logging.getLogger(__name__)
+
+# Default number of Spotify searches kept in flight at once; kept modest to
+# stay clear of Spotify's rate limits
+SEARCH_WORKERS = 8
+
+# Spotify accepts at most 100 items per playlist_add_items request
+PLAYLIST_ADD_BATCH = 100
+
+# HTTP status codes that are retried with exponential backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Brackets and double quotes are search syntax to Spotify, so they are removed
+# from query terms in one pass. Apostrophes are part of many titles and stay
+_QUERY_STRIP_TABLE = str.maketrans('', '', '()[]{}"')
+
+_search_cache = SearchCache()
+
+_spotify_client = None
+_spotify_client_lock = threading.Lock()
+_spotify_user_id = None
+
+def _build_spotify_session():
+    """
+    Build the requests session shared by the Spotify client and its auth manager.
+    
+    The session keeps a pool of keep-alive connections to the Spotify API large
+    enough for the concurrent searches, and retries rate-limited and failed
+    requests with backoff (honouring Retry-After).
+    
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=5,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True)
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry))
+    return session
+
+class _MemoizedCacheFileHandler(CacheFileHandler):
+    """
+    Token cache that reads the token file once and then answers from memory.
+    
+    spotipy asks the auth manager for the access token before every API call,
+    and the default CacheFileHandler re-reads and re-parses the token file each
+    time. Refreshed tokens are still written through to the file.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._token_info = None
+    
+    def get_cached_token(self):
+        if self._token_info is None:
+            self._token_info = super().get_cached_token()
+        return self._token_info
+    
+    def save_token_to_cache(self, token_info):
+        self._token_info = token_info
+        super().save_token_to_cache(token_info)
+
+def get_spotify_client():
+    """
+    Get the shared authenticated Spotify client, creating it on first use.
+    
+    Returns:
+        spotipy.Spotify or None: The Spotify client, or None if it could not be set up.
+    """
+    global _spotify_client
+    if _spotify_client is not None:
+        return _spotify_client
+    
+    with _spotify_client_lock:
+        if _spotify_client is None:
+            try:
+                config = get_config()
+                
+                # We need additional scopes for modifying library and playlists
+                scope = "user-library-read user-library-modify playlist-modify-public"
+
+                session = _build_spotify_session()
+                _spotify_client = spotipy.Spotify(
+                    auth_manager=SpotifyOAuth(
+                        client_id=config.spotify_client_id,
+                        client_secret=config.spotify_client_secret,
+                        redirect_uri=config.spotify_redirect_uri,
+                        scope=scope,
+                        open_browser=True,
+                        cache_handler=_MemoizedCacheFileHandler(),
+                        requests_session=session),
+                    requests_session=session)
+            except Exception as e:
+                logger.error("Error setting up Spotify client: %s", e)
+                logger.error("Please check your Spotify credentials in your .env file.")
+                return None
+    
+    return _spotify_client
+
+def get_spotify_user_id():
+    """
+    Get the ID of the authenticated Spotify user, looking it up only once.
+    
+    Returns:
+        str: The Spotify user ID.
+        
+    Raises:
+        spotipy.SpotifyException: If the lookup fails.
+    """
+    global _spotify_user_id
+    if _spotify_user_id is None:
+        _spotify_user_id = get_spotify_client().me()['id']
+    return _spotify_user_id
+
 class PlaylistBuilder:
     """
     Class responsible for creating Spotify playlists from track data.
@@ -21,71 +161,192 @@ class PlaylistBuilder:
     """
     
     def __init__(self):
-        """Initialize the PlaylistBuilder with Spotify authentication."""
-        self.config = EnvConfig()
-        self.spotify_client = self._setup_spotify_client()
+        """Initialize the PlaylistBuilder; Spotify authentication happens on first use."""
+        self.config = get_config()
+        self._spotify_client = None
+
+    @property
+    def spotify_client(self):
+        """
+        Get the authenticated Spotify client, setting it up on first access.
+        
+        Returns:
+            spotipy.Spotify or None: The Spotify client, or None if it could not be set up.
+        """
+        if self._spotify_client is None:
+            self._spotify_client = self._setup_spotify_client()
+        return self._spotify_client
 
     def _setup_spotify_client(self):
         """
         Set up and return an authenticated Spotify client.
         
+        The client is shared across all PlaylistBuilder instances; see
+        get_spotify_client().
+        
         Returns:
             spotipy.Spotify: An authenticated Spotify client.
         """
-        try:
-            # We need additional scopes for modifying library and playlists
-            scope = "user-library-read user-library-modify playlist-modify-public"
-
-            sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-                client_id=self.config.spotify_client_id,
-                client_secret=self.config.spotify_client_secret,
-                redirect_uri=self.config.spotify_redirect_uri,
-                scope=scope,
-                open_browser=True))
-
-            return sp
-        except Exception as e:
-            print(f"Error setting up Spotify client: {e}")
-            print("Please check your Spotify credentials in your .env file.")
-            return None
+        return get_spotify_client()
     
-    def search_song(self, title, artist):
+    @staticmethod
+    def build_query(title, artist):
+        """
+        Build the Spotify search query for a song.
+        
+        Args:
+            title (str): The title of the song.
+            artist (str): The artist of the song, may be empty.
+            
+        Returns:
+            str: The search query.
+        """
+        title = title.translate(_QUERY_STRIP_TABLE).strip()
+        if artist:
+            artist = artist.translate(_QUERY_STRIP_TABLE).strip()
+            return f"track:{title} artist:{artist}"
+        return f"track:{title}"
+    
+    def search_song(self, title, artist, query=None):
         """
         Search for a song on Spotify and return its URI.
         
+        Songs that were searched for before (in this or an earlier run) are
+        answered from the search cache without contacting Spotify, including
+        songs that Spotify did not find.
+        
         Args:
             title (str): The title of the song.
             artist (str): The artist of the song.
+            query (str, optional): A prebuilt search query. Built from the title
+                                   and artist with build_query() if omitted.
             
         Returns:
             str or None: The Spotify URI of the song if found, None otherwise.
         """
+        cached_uri = _search_cache.get((title, artist))
+        if cached_uri is not None:
+            if not cached_uri:
+                logger.info("No results found (cached): %s - %s", title, artist)
+                return None
+            logger.info("Found (cached): %s - %s", title, artist)
+            return cached_uri
+        
         if not self.spotify_client:
             return None
             
         try:
             # Create search query
-            query = f"track:{title}"
-            if artist:
-                query += f" artist:{artist}"
+            if query is None:
+                query = self.build_query(title, artist)
 
             # Perform search
             results = self.spotify_client.search(q=query, type='track', limit=1)
+            if not results:
+                # spotipy returns None when the response body isn't JSON
+                logger.error("Empty response from Spotify searching for %s", query)
+                return None
             
-            # Get uri - this is what spotify needs
-            items = results.get('tracks', {}).get('items', [])
-            if items:
-                uri = items[0]['uri']
-                print(f"Found: {items[0]['name']} - {items[0]['artists'][0]['name']}")
-                return uri
+            items = results.get('tracks', {}).get('items')
+            if not items:
+                logger.info("No results found for %s", query)
+                _search_cache.set((title, artist), "", ttl=MISS_TTL)
+                return None
             
-            print(f"No results found for {query}")
+            # Get uri - this is what spotify needs
+            track = items[0]
+            uri = track['uri']
+            logger.info("Found: %s - %s", track['name'], track['artists'][0]['name'])
+            _search_cache.set((title, artist), uri)
+            return uri
+        except spotipy.SpotifyException as e:
+            # Rate-limited and failed requests have already been retried with
+            # backoff by the session; only give up on the song once that is exhausted
+            if e.http_status == 429:
+                logger.warning("Still rate limited by Spotify after retrying, skipping: %s - %s", title, artist)
+            else:
+                logger.error("Error searching for song: %s", e)
+            return None
+        except (spotipy.exceptions.SpotifyBaseException, requests.exceptions.RequestException) as e:
+            # Includes token refresh failures (SpotifyOauthError)
+            logger.error("Error searching for song: %s", e)
             return None
         except Exception as e:
-            print(f"Error searching for song: {e}")
+            # Skip the song rather than abort the whole playlist, e.g. on an
+            # unexpected response payload
+            logger.error("Error searching for song %s - %s: %s", title, artist, e)
             return None
     
-    def create_playlist(self, tracks_data, playlist_name, description, limit=30):
+    def _search_track(self, i, position, title, artist, query, limit):
+        """
+        Search Spotify for a single entry of the tracks data.
+        
+        Args:
+            i (int): The 1-based index of the track, used for progress output.
+            position (str or None): The chart position, if the source has one.
+            title (str): The title of the song.
+            artist (str): The artist of the song.
+            query (str): The prebuilt search query.
+            limit (int): The number of tracks being searched, used for progress output.
+            
+        Returns:
+            str or None: The Spotify URI of the song if found, None otherwise.
+        """
+        if position is not None:
+            logger.info("(%d/%d) Searching for: #%s: %s - %s", i, limit, position, title, artist)
+        else:
+            logger.info("(%d/%d) Searching for: %s - %s", i, limit, title, artist)
+            
+        return self.search_song(title, artist, query=query)
+    
+    def _search_workers(self):
+        """
+        Get the number of concurrent Spotify searches to run.
+        
+        Returns:
+            int: The MTM_SEARCH_WORKERS environment variable if it is set to a
+                 positive number, SEARCH_WORKERS otherwise.
+        """
+        value = self.config.get("MTM_SEARCH_WORKERS", "")
+        if not value:
+            return SEARCH_WORKERS
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            logger.warning("Ignoring invalid MTM_SEARCH_WORKERS=%r, using %d", value, SEARCH_WORKERS)
+            return SEARCH_WORKERS
+        return workers
+    
+    @staticmethod
+    def _dedupe_tracks(tracks):
+        """
+        Drop repeated songs from the tracks data, keeping the first occurrence.
+        
+        Songs are compared by normalized (title, artist), the same key the
+        search cache uses, so duplicates that differ only in case or
+        surrounding whitespace are searched for once.
+        
+        Args:
+            tracks (list): Tuples of (title, artist) or (position, title, artist).
+            
+        Returns:
+            list: The tracks in their original order, without duplicates.
+        """
+        seen = set()
+        unique = []
+        for track in tracks:
+            key = normalize_key((track[-2], track[-1]))
+            if key not in seen:
+                seen.add(key)
+                unique.append(track)
+        
+        if len(unique) < len(tracks):
+            logger.info("Skipping %d duplicate tracks", len(tracks) - len(unique))
+        return unique
+    
+    def create_playlist(self, tracks_data, playlist_name, description, limit=30, max_workers=None):
         """
         Create a Spotify playlist with the given tracks.
         
@@ -94,53 +355,88 @@ class PlaylistBuilder:
             playlist_name (str): The name for the playlist.
             description (str): Description for the playlist.
             limit (int, optional): Maximum number of songs to add. Defaults to 30.
+            max_workers (int, optional): Number of concurrent Spotify searches.
+                                         Defaults to the MTM_SEARCH_WORKERS environment
+                                         variable, or SEARCH_WORKERS if it is not set;
+                                         1 searches serially.
             
         Returns:
             str or None: The URL of the created playlist if successful, None otherwise.
         """
         if not tracks_data:
-            print("No tracks data available to create a playlist.")
+            logger.warning("No tracks data available to create a playlist.")
             return None
             
         if not self.spotify_client:
             return None
         
-        # Search for each song on Spotify and collect URIs
-        spotify_uris = []
-        for i, track_info in enumerate(tracks_data[:limit], 1):
-            # Handle different formats of track_info
-            if len(track_info) == 3:  # (position, title, artist)
-                position, title, artist = track_info
-                print(f"({i}/{limit}) Searching for: #{position}: {title} - {artist}")
-            else:  # (title, artist)
-                title, artist = track_info
-                print(f"({i}/{limit}) Searching for: {title} - {artist}")
-                
-            uri = self.search_song(title, artist)
-            if uri:
-                spotify_uris.append(uri)
+        if max_workers is None:
+            max_workers = self._search_workers()
+        
+        # Fetch (or refresh) the access token up front so the worker threads
+        # don't each try to run the OAuth flow
+        try:
+            self.spotify_client.auth_manager.get_access_token(as_dict=False)
+        except Exception as e:
+            logger.error("Error authenticating with Spotify: %s", e)
+            return None
+        
+        # Drop duplicate songs, then split the tracks into parallel columns,
+        # handling both the (title, artist) and (position, title, artist)
+        # formats, and build every search query in one pass
+        tracks = self._dedupe_tracks(tracks_data[:limit])
+        positions = [track[0] if len(track) == 3 else None for track in tracks]
+        titles = [track[-2] for track in tracks]
+        artists = [track[-1] for track in tracks]
+        queries = list(map(self.build_query, titles, artists))
+        
+        # Search for each song on Spotify and collect URIs; map() yields the
+        # results in chart order even though the searches run concurrently.
+        # The user ID needed to create the playlist is looked up alongside them.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            user_id = executor.submit(get_spotify_user_id)
+            results = executor.map(
+                self._search_track,
+                range(1, len(tracks) + 1), positions, titles, artists, queries, repeat(limit)
+            )
+            found_uris = [uri for uri in results if uri]
+        
+        # Persist the search results now, so they survive even if creating
+        # the playlist fails or the run is interrupted
+        _search_cache.save()
+        
+        # Different chart entries can resolve to the same Spotify track (e.g. a
+        # song and its remix); add each track once, at its first position
+        spotify_uris = list(dict.fromkeys(found_uris))
         
-        print(f"Found {len(spotify_uris)} tracks on Spotify")
+        logger.info("Found %d tracks on Spotify", len(spotify_uris))
+        if len(spotify_uris) < len(found_uris):
+            logger.info("Skipping %d songs that matched a track already in the playlist",
+                        len(found_uris) - len(spotify_uris))
         
         # Create the playlist
         if not spotify_uris:
-            print("No songs found to add to playlist.")
+            logger.warning("No songs found to add to playlist.")
             return None
             
         try:
             playlist = self.spotify_client.user_playlist_create(
-                user=self.spotify_client.me()['id'], 
+                user=user_id.result(),
                 name=playlist_name, 
                 public=True, 
                 description=description
             )
-            print(f"Created playlist: {playlist['name']}")
+            logger.info("Created playlist: %s", playlist['name'])
             
-            for i in range(0, len(spotify_uris), 100):
-                self.spotify_client.playlist_add_items(playlist_id=playlist['id'], items=spotify_uris[i:i+100])
-                print(f"Added {len(spotify_uris[i:i+100])} songs to playlist")
+            # Add the songs in as few requests as Spotify allows. The batches
+            # are sent one after another: Spotify appends each batch as it
+            # arrives, so concurrent requests could scramble the chart order.
+            remaining = iter(spotify_uris)
+            while batch := list(islice(remaining, PLAYLIST_ADD_BATCH)):
+                self.spotify_client.playlist_add_items(playlist_id=playlist['id'], items=batch)
+                logger.info("Added %d songs to playlist", len(batch))
             
             return playlist['external_urls']['spotify']  # Return the Spotify URL to the playlist
         except Exception as e:
-            print(f"Error creating playlist: {e}")
+            logger.error("Error creating playlist: %s", e)
             return None 
\ No newline at end of file
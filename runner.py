@@ -0,0 +1,122 @@
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+from main import configure_logging
+from scrapers.AppleMusic_EDM import AppleMusicEDMScraper
+from scrapers.billboard import BillboardTop100Scraper
+from scrapers.soundcloud import SoundCloudEDMScraper
+from scrapers.traxsource_deep_house import TraxsourceDeepHouseScraper
+
+"""
+Scraper Runner Module
+
+This module scrapes several charts at once, running each scraper in its own
+process. Parsing the chart pages and cleaning up titles is CPU-bound and holds
+the GIL, so separate processes let a full refresh of every chart use all of
+the machine's cores instead of one.
+
+Only the scraping runs in the worker processes. Scrapers never talk to
+Spotify, so the workers don't share (or race on) the Spotify token cache; the
+scraped tracks are returned to the parent, which can hand them to a
+PlaylistBuilder as usual.
+
+When the pages are slow to download rather than slow to parse, the scrapers
+can run in threads of this process instead: requests releases the GIL while
+waiting on the network, so the total time is that of the slowest chart, and
+no worker processes have to be started.
+
+Usage:
+    python runner.py              # scrape all current charts
+    python runner.py 2021-01-01   # also scrape the Billboard Hot 100 for that date
+    python runner.py --threads    # run the scrapers in threads instead of processes
+"""
+
+logger = logging.getLogger(__name__)
+
+def run_scraper(job):
+    """
+    Run a single scraper; used as the worker function of the process pool.
+
+    Args:
+        job (tuple): The scraper class and a tuple of arguments for its scrape() method.
+
+    Returns:
+        list: The scraped tracks data, or an empty list if scraping failed.
+    """
+    scraper_class, args = job
+    try:
+        scraper = scraper_class()
+        if not scraper.scrape(*args):
+            return []
+        return scraper.get_tracks_data()
+    except Exception:
+        # Don't let one chart's failure lose the results of all the others
+        logger.exception("Error running %s", scraper_class.__name__)
+        return []
+
+def scrape_all(jobs, processes=None, threads=False):
+    """
+    Run several scrapers in parallel, one process (or thread) per scraper.
+
+    Args:
+        jobs (list): (scraper class, scrape() arguments) tuples.
+        processes (int, optional): Number of worker processes. Defaults to one
+                                   per job, capped at the number of CPUs.
+        threads (bool, optional): Run one thread per job in this process
+                                  instead of using a process pool. Defaults to False.
+
+    Returns:
+        list: The tracks data of each job, in the same order as the jobs.
+    """
+    if threads:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            return list(executor.map(run_scraper, jobs))
+
+    if processes is None:
+        processes = min(len(jobs), os.cpu_count() or 1)
+
+    # Workers may be started fresh (spawn/forkserver) rather than forked, so
+    # they set up logging themselves
+    with Pool(processes, initializer=configure_logging) as pool:
+        return pool.map(run_scraper, jobs)
+
+def run_all(target_date=None, threads=False):
+    """
+    Scrape every chart in parallel.
+
+    Args:
+        target_date (str, optional): A date in format YYYY-MM-DD to also scrape
+                                     the Billboard Hot 100 for.
+        threads (bool, optional): Run the scrapers in threads instead of
+                                  processes. Defaults to False.
+
+    Returns:
+        list: (scraper class, tracks data) tuples, one per chart.
+    """
+    jobs = [
+        (SoundCloudEDMScraper, ()),
+        (AppleMusicEDMScraper, ()),
+        (TraxsourceDeepHouseScraper, ()),
+    ]
+    if target_date:
+        jobs.insert(0, (BillboardTop100Scraper, (target_date,)))
+
+    results = scrape_all(jobs, threads=threads)
+    return [(scraper_class, tracks_data) for (scraper_class, _), tracks_data in zip(jobs, results)]
+
+def main():
+    """Scrape every chart in parallel and report how many tracks each returned."""
+    configure_logging()
+
+    args = sys.argv[1:]
+    threads = "--threads" in args
+    if threads:
+        args.remove("--threads")
+
+    for scraper_class, tracks_data in run_all(args[0] if args else None, threads=threads):
+        print(f"{scraper_class.__name__}: {len(tracks_data)} tracks")
+
+if __name__ == "__main__":
+    main()
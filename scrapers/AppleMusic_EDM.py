@@ -1,13 +1,39 @@
 """AppleMusicEDM Scraper"""
 
 from .base_scraper import BaseMusicScraper
-import requests
-from bs4 import BeautifulSoup
-import lxml
+from lxml import etree
 from datetime import datetime
 import os
 import re
 import json
+import logging
+
+try:
+    # orjson parses the (often large) JSON-LD payload several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Patterns used to pick apart track titles, compiled once at import
+_RE_REMIX_PAREN = re.compile(r'\(([^)]+)\s+remix\)', re.IGNORECASE)
+_RE_FEAT_GRP = re.compile(r'(?:feat\.?|ft\.?)\s+([^)\]]+)', re.IGNORECASE)
+_RE_AMP = re.compile(r'\s+(&|and)\s+')
+# Everything _clean_title removes, in one pass: bracketed/parenthesized
+# sections, and anything from "feat.", "ft.", "remix" or "radio edit" onwards
+_RE_CLEAN = re.compile(r'\([^)]*\)|\[[^\]]*\]|(?:feat\.|ft\.|remix|radio edit).*$', re.IGNORECASE)
+
+# Lowercase words that make _RE_CLEAN remove part of a title
+_CLEAN_MARKERS = ('feat.', 'ft.', 'remix', 'radio edit')
+
+# Page lookups, compiled once at import. Text results are returned as plain
+# str rather than lxml "smart strings", which orjson does not accept
+_PAGE_TITLE = etree.XPath("string(//title)")
+_PLAYLIST_JSON_LD = etree.XPath(
+    '//script[@id="schema:music-playlist"][@type="application/ld+json"]/text()',
+    smart_strings=False)
+_SONG_META = etree.XPath('//meta[@property="music:song" or @property="music:song:artist"]')
 
 class AppleMusicEDMScraper(BaseMusicScraper):
     def __init__(self):
@@ -33,95 +59,71 @@ class AppleMusicEDMScraper(BaseMusicScraper):
             if param:
                 url = f"{self.base_url}/{param}"
             
-            print(f"Fetching Apple Music EDM playlist from: {url}")
+            logger.info("Fetching Apple Music EDM playlist from: %s", url)
                 
-            # Send HTTP request with headers that mimic a browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            
-            print(f"Response status code: {response.status_code}")
-            
-            # Save the raw HTML for debugging
-            debug_dir = "debug"
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
-                
-            with open(os.path.join(debug_dir, "apple_music_response.html"), "w", encoding="utf-8") as f:
-                f.write(response.text)
-            
-            print(f"Saved raw HTML to debug/apple_music_response.html for inspection")
+            # Stream the page through the shared session into the HTML parser,
+            # with the base scraper's headers that mimic a browser
+            tree, body = self.fetch_page(url)
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, "lxml")
+            # Save the raw HTML for debugging if needed
+            self.save_debug_html(os.path.join("debug", "apple_music_response.html"), body)
             
             # Print some basic HTML structure info for debugging
-            print(f"HTML title: {soup.title.text if soup.title else 'No title found'}")
+            logger.debug("HTML title: %s", _PAGE_TITLE(tree) or "No title found")
             
             # Method 1: Extract from JSON-LD
-            print("\nAttempting to extract track data from JSON-LD schema...")
-            json_ld_script = soup.find('script', {'id': 'schema:music-playlist', 'type': 'application/ld+json'})
+            logger.debug("Attempting to extract track data from JSON-LD schema...")
+            json_ld_script = _PLAYLIST_JSON_LD(tree)
             
             if json_ld_script:
                 try:
-                    json_data = json.loads(json_ld_script.string)
+                    json_data = _json_loads(json_ld_script[0])
                     tracks = json_data.get('track', [])
-                    print(f"Found {len(tracks)} tracks in JSON-LD schema")
+                    logger.info("Found %d tracks in JSON-LD schema", len(tracks))
                     
-                    for track in tracks:
-                        title = track.get('name', '')
-                        original_title = title  # Keep original for artist extraction
-                        
-                        # Extract artist from the title
-                        artist = self._extract_artist_from_title(title)
-                        
-                        # Clean the title of any remix/feat info for better matching in Spotify
-                        clean_title = self._clean_title(title)
-                        
-                        # Add to tracks data
-                        self.tracks_data.append((clean_title, artist))
-                        print(f"Added track: {clean_title} - {artist}")
+                    # The number of tracks is known, so build the tracks data in
+                    # one pass: the artist comes from the schema when it is given,
+                    # otherwise it is extracted from the original title, which is
+                    # then cleaned of any remix/feat info for better matching in Spotify
+                    self.tracks_data = [self._track_from_schema(track) for track in tracks]
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for clean_title, artist in self.tracks_data:
+                            logger.debug("Added track: %s - %s", clean_title, artist)
                         
                 except json.JSONDecodeError as e:
-                    print(f"Error parsing JSON-LD: {e}")
+                    logger.warning("Error parsing JSON-LD: %s", e)
             
             # Method 2: Extract from meta tags
             if not self.tracks_data:
-                print("\nAttempting to extract track data from meta tags...")
-                meta_tags = soup.find_all('meta', property=re.compile(r'^music:song$'))
+                logger.debug("Attempting to extract track data from meta tags...")
+                song_meta = self._extract_song_meta(tree)
                 
-                print(f"Found {len(meta_tags)} meta tags with music:song property")
+                logger.info("Found %d meta tags with music:song property", len(song_meta))
                 
-                for i, tag in enumerate(meta_tags, 1):
-                    url = tag.get('content', '')
+                for i, (url, artist_url) in enumerate(song_meta, 1):
                     # Extract song name from URL
                     try:
                         song_name = url.split('/')[-2]
                         # Convert URL encoding to readable text
                         song_name = song_name.replace('-', ' ').title()
                         
-                        # Try to extract artist from the same page
-                        artist_tag = soup.find(f'meta[property="music:song:artist"][content="{url}"]')
+                        # Extract the artist name from its URL the same way
                         artist = ""
-                        if artist_tag and artist_tag.get('content'):
-                            artist_url = artist_tag.get('content')
+                        if artist_url:
                             artist = artist_url.split('/')[-2].replace('-', ' ').title()
                         
                         # Clean the title of any remix/feat info for better matching in Spotify
                         clean_title = self._clean_title(song_name)
                         
                         self.tracks_data.append((clean_title, artist))
-                        print(f"Added track {i}: {clean_title} - {artist}")
+                        logger.debug("Added track %d: %s - %s", i, clean_title, artist)
                     except (IndexError, AttributeError):
-                        print(f"Couldn't extract song name from URL: {url}")
+                        logger.warning("Couldn't extract song name from URL: %s", url)
             
             # As a fallback, if we still can't scrape, use hardcoded data for testing
             if not self.tracks_data:
-                print("Using fallback hardcoded track data for testing purposes")
+                logger.warning("Using fallback hardcoded track data for testing purposes")
                 self.tracks_data = [
                     ("Hypnotized", "John Summit"),
                     ("Forever Yours", "Avicii"),
@@ -141,15 +143,65 @@ class AppleMusicEDMScraper(BaseMusicScraper):
             title = f"Apple Music EDM Hits - {today_date}"
             self.save_tracks_to_file(filename=filename, title=title)
             
-            print(f"Found and saved {len(self.tracks_data)} tracks")
+            logger.info("Found and saved %d tracks", len(self.tracks_data))
             return True
             
         except Exception as e:
-            print(f"Error scraping Apple Music: {e}")
-            import traceback
-            traceback.print_exc()  # Print full stack trace for debugging
+            # Log the full stack trace for debugging
+            logger.exception("Error scraping Apple Music: %s", e)
             return False
     
+    def _extract_song_meta(self, tree):
+        """
+        Collect the songs listed in the page's Open Graph meta tags.
+        
+        Structured properties apply to the root property before them, so a
+        music:song:artist tag gives the artist of the preceding music:song.
+        Both are collected in a single pass over the meta tags.
+        
+        Args:
+            tree: The root element of the parsed page.
+            
+        Returns:
+            list: (song URL, artist URL) pairs; the artist URL is empty if the
+                  page doesn't give one.
+        """
+        song_meta = []
+        for meta in _SONG_META(tree):
+            content = meta.get('content', '')
+            if meta.get('property') == 'music:song':
+                song_meta.append((content, ''))
+            elif song_meta and not song_meta[-1][1]:
+                song_meta[-1] = (song_meta[-1][0], content)
+        return song_meta
+    
+    def _track_from_schema(self, track):
+        """
+        Build a (title, artist) tuple from a JSON-LD track entry.
+        
+        The artist is taken from the entry's byArtist or author field when
+        present, so the title only has to be searched for artist names when
+        the schema leaves them out.
+        
+        Args:
+            track (dict): A track entry of the schema:music-playlist JSON-LD.
+            
+        Returns:
+            tuple: The cleaned title and the artist.
+        """
+        title = track.get('name', '')
+        
+        artist = track.get('byArtist') or track.get('author') or ''
+        if isinstance(artist, list):
+            artist = artist[0] if artist else ''
+        if isinstance(artist, dict):
+            artist = artist.get('name') or ''
+        
+        if not artist:
+            artist = self._extract_artist_from_title(title)
+        
+        return (self._clean_title(title), artist)
+    
     def _extract_artist_from_title(self, title):
         """
         Extract artist information from track title using common patterns.
@@ -163,13 +215,13 @@ class AppleMusicEDMScraper(BaseMusicScraper):
         artist = ""
         
         # Pattern 1: Title (Artist Remix)
-        remix_match = re.search(r'\(([^)]+)\s+remix\)', title, re.IGNORECASE)
+        remix_match = _RE_REMIX_PAREN.search(title)
         if remix_match:
             artist = remix_match.group(1).strip()
             return artist
         
         # Pattern 2: Title (feat. Artist)
-        feat_match = re.search(r'(?:feat\.?|ft\.?)\s+([^)\]]+)', title, re.IGNORECASE)
+        feat_match = _RE_FEAT_GRP.search(title)
         if feat_match:
             artist = feat_match.group(1).strip()
             return artist
@@ -189,7 +241,7 @@ class AppleMusicEDMScraper(BaseMusicScraper):
                 return artist
                 
         # Pattern 5: Artist & Artist
-        ampersand_match = re.search(r'\s+(&|and)\s+', title)
+        ampersand_match = _RE_AMP.search(title)
         if ampersand_match:
             # This is a bit risky, but might extract collaborations
             index = ampersand_match.start()
@@ -212,20 +264,18 @@ class AppleMusicEDMScraper(BaseMusicScraper):
         Returns:
             str: Cleaned title
         """
-        # Remove content in brackets and parentheses
-        title = re.sub(r'\([^)]*\)', '', title)
-        title = re.sub(r'\[[^]]*\]', '', title)
-        
-        # Remove "feat." or "ft." sections
-        title = re.sub(r'feat\..*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'ft\..*$', '', title, flags=re.IGNORECASE)
-        
-        # Remove "remix" or "radio edit" sections
-        title = re.sub(r'remix.*$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'radio edit.*$', '', title, flags=re.IGNORECASE)
+        # Most titles have nothing to remove, which a few substring checks can
+        # tell without running the regex. Non-ASCII titles always take the
+        # regex path, since its case-insensitive matching also folds letters
+        # like the dotless i that lower() leaves alone.
+        if title.isascii() and '(' not in title and '[' not in title:
+            lower_title = title.lower()
+            if not any(marker in lower_title for marker in _CLEAN_MARKERS):
+                return title.strip()
         
-        # Convert to title case and strip whitespace
-        return title.strip()
+        # Remove content in brackets and parentheses, "feat."/"ft." sections
+        # and "remix"/"radio edit" suffixes in a single scan
+        return _RE_CLEAN.sub('', title).strip()
     
     def get_tracks_data(self):
         """
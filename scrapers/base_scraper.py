@@ -1,7 +1,12 @@
+import os
+import logging
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from abc import ABC, abstractmethod
-from env_variables import EnvConfig
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from env_variables import get_config
 
 """
 Base Scraper Module
@@ -16,8 +21,64 @@ The base class handles common functionality like:
 
 This class focuses exclusively on data extraction, with playlist creation
 now being handled by the separate PlaylistBuilder class.
+
+All scrapers share a single requests.Session so connections (and their TLS
+handshakes) are kept alive and reused between requests; connection errors,
+rate limiting and server errors are retried with backoff. Responses are
+requested compressed, with brotli (br) offered alongside gzip when the brotli
+package is installed, which shrinks large pages such as Apple Music's.
 """
 
+logger = logging.getLogger(__name__)
+
+# Size of the chunks read from streamed responses and fed to the parsers
+CHUNK_SIZE = 16384
+
+# Connect and read timeouts, in seconds, for scraper requests
+REQUEST_TIMEOUT = (5, 30)
+
+# HTTP status codes that are retried with exponential backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUS_CODES)))
+
+def class_xpath(tag, *classes):
+    """
+    Build an XPath step matching a tag that has all of the given CSS classes.
+    
+    Args:
+        tag (str): The element name.
+        *classes (str): The CSS class names the element must have.
+        
+    Returns:
+        str: The XPath step, equivalent to the CSS selector tag.class1.class2.
+    """
+    tests = " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in classes
+    )
+    return f"{tag}[{tests}]"
+
+def response_charset(response):
+    """
+    Get the character set declared in a response's Content-Type header.
+    
+    Pages are parsed from their raw bytes, so the declared charset is passed to
+    lxml explicitly; without one, lxml falls back to the page's <meta charset>.
+    
+    Args:
+        response (requests.Response): The HTTP response.
+        
+    Returns:
+        str or None: The declared charset, or None if the header has none.
+    """
+    if 'charset=' not in response.headers.get('Content-Type', '').lower():
+        return None
+    return response.encoding
+
 class BaseMusicScraper(ABC):
     """
     Base class for music chart scrapers.
@@ -31,12 +92,15 @@ class BaseMusicScraper(ABC):
     
     def __init__(self):
         """Initialize the base scraper with common attributes."""
-        self.config = EnvConfig()
+        self.config = get_config()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            # gzip and deflate, plus br when the brotli package is installed to decode it
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
         }
+        self.session = _session
         self.tracks_data = []
     
     @abstractmethod
@@ -61,6 +125,69 @@ class BaseMusicScraper(ABC):
         """
         return self.tracks_data
     
+    def fetch_page(self, url):
+        """
+        Stream a page from the web into lxml's HTML parser.
+        
+        The body is parsed as it arrives rather than being decoded to text
+        and parsed in one go after the download. A body with nothing to parse
+        (e.g. an empty response) gives an empty <html> element rather than
+        an error, so callers simply find no tracks in it.
+        
+        Args:
+            url (str): The URL of the page.
+            
+        Returns:
+            tuple: The root element of the parsed page and the raw bytes received.
+            
+        Raises:
+            requests.HTTPError: If the server returns an error status.
+        """
+        received = []
+        
+        with self.session.get(url, headers=self.headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            
+            parser = lxml_html.HTMLParser(encoding=response_charset(response))
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                received.append(chunk)
+                parser.feed(chunk)
+        
+        try:
+            tree = parser.close()
+        except etree.LxmlError:
+            tree = None
+        if tree is None:
+            tree = lxml_html.Element("html")
+        
+        return tree, b"".join(received)
+    
+    def save_debug_html(self, filename, content):
+        """
+        Save a raw HTML response to disk for debugging.
+        
+        Nothing is written unless the MTM_DEBUG_HTML environment variable is set,
+        so normal runs skip the extra disk write.
+        
+        Args:
+            filename (str): The name of the file to save to; missing parent
+                            directories are created.
+            content (bytes): The raw response body.
+            
+        Returns:
+            bool: True if the file was written, False otherwise.
+        """
+        if not self.config.get("MTM_DEBUG_HTML", ""):
+            return False
+            
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, 'wb') as f:
+            f.write(content)
+        logger.info("Saved raw HTML to %s for inspection", filename)
+        return True
+    
     def save_tracks_to_file(self, filename, title):
         """
         Save the scraped track information to a text file.
@@ -70,20 +197,23 @@ class BaseMusicScraper(ABC):
             title (str): The title for the list of tracks.
         """
         if not self.tracks_data:
-            print("No tracks to save.")
+            logger.warning("No tracks to save.")
             return
             
+        # Build the whole file in memory and write it with a single call
+        lines = [f"{title}\n\n"]
+        for i, track_info in enumerate(self.tracks_data, 1):
+            if len(track_info) == 3:  # Billboard format (position, title, artist)
+                position, track_title, artist = track_info
+                lines.append(f"{i}. #{position}: {track_title} - {artist}\n")
+            elif len(track_info) == 2:  # SoundCloud format (title, artist)
+                track_title, artist = track_info
+                lines.append(f"{i}. {track_title} - {artist}\n")
+        
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"{title}\n\n")
-                for i, track_info in enumerate(self.tracks_data, 1):
-                    if len(track_info) == 3:  # Billboard format (position, title, artist)
-                        position, title, artist = track_info
-                        f.write(f"{i}. #{position}: {title} - {artist}\n")
-                    elif len(track_info) == 2:  # SoundCloud format (title, artist)
-                        title, artist = track_info
-                        f.write(f"{i}. {title} - {artist}\n")
+                f.write("".join(lines))
             
-            print(f"Track information saved to {filename}")
+            logger.info("Track information saved to %s", filename)
         except Exception as e:
-            print(f"Error saving tracks to file: {e}") 
\ No newline at end of file
+            logger.error("Error saving tracks to file: %s", e)
\ No newline at end of file
@@ -1,6 +1,13 @@
-from .base_scraper import BaseMusicScraper
-from bs4 import BeautifulSoup
-import requests
+from .base_scraper import CHUNK_SIZE, REQUEST_TIMEOUT, BaseMusicScraper, class_xpath, response_charset
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from lxml import etree
+import gzip
+import logging
+import os
+import sys
+import tempfile
 
 """
 Billboard Hot 100 Scraper Module
@@ -14,8 +21,43 @@ Example usage:
     if scraper.scrape("2021-01-01"):
         tracks_data = scraper.get_tracks_data()
         # tracks_data can now be used with a PlaylistBuilder to create playlists
+
+    # Or several dates at once, downloaded in parallel:
+    charts = BillboardTop100Scraper.scrape_many_dates(["2021-01-02", "2021-01-09"])
+    # charts maps each date to its tracks data (empty if scraping failed)
+
+Charts more than a week old no longer change, so their pages are cached
+(gzipped) in CHART_CACHE_DIR and later scrapes of the same date skip the
+download entirely.
 """
 
+logger = logging.getLogger(__name__)
+
+# Number of rows on a complete chart; the download stops once they have been parsed
+CHART_SIZE = 100
+
+# Where pages of past charts are cached, and how old a chart must be to be cached
+CHART_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mtm")
+CHART_FINAL_AFTER = timedelta(days=7)
+
+# Default number of chart dates scrape_many_dates() fetches at once; within
+# the shared session's connection pool, and modest enough not to hammer Billboard
+SCRAPE_DATES_WORKERS = 8
+
+# A song on the chart. Still a (position, title, artist) tuple, so it can be
+# used anywhere the tracks data is, but with named fields
+ChartEntry = namedtuple("ChartEntry", ["position", "title", "artist"])
+
+# Compiled once at import so each scrape only pays for the tree walk
+_IS_CHART_ROW = etree.XPath("boolean(self::" + class_xpath("ul", "o-chart-results-list-row") + ")")
+# The title, artist and position elements of a row, found in one walk of the
+# row. They come back in document order, and any of them may be missing
+_ROW_FIELDS = etree.XPath(" | ".join((
+    ".//" + class_xpath("h3", "c-title"),
+    ".//" + class_xpath("span", "c-label", "a-no-trucate"),
+    ".//" + class_xpath("span", "c-label", "a-font-primary-bold-l"),
+)))
+
 class BillboardTop100Scraper(BaseMusicScraper):
     """
     Scraper for Billboard Hot 100 chart.
@@ -28,6 +70,8 @@ class BillboardTop100Scraper(BaseMusicScraper):
         """Initialize the Billboard scraper."""
         super().__init__()
         self.base_url = "https://www.billboard.com/charts/hot-100"
+        # Where the raw page is saved when MTM_DEBUG_HTML is set
+        self.debug_html_filename = "billboard_debug.html"
     
     def scrape(self, target_date):
         """
@@ -40,48 +84,23 @@ class BillboardTop100Scraper(BaseMusicScraper):
             bool: True if scraping was successful, False otherwise.
         """
         try:
-            # Construct the URL for the specific date
-            url = f"{self.base_url}/{target_date}"
-            print(f"Fetching data from: {url}")
-            
-            # Make the request
-            response = requests.get(url, headers=self.headers)
+            # Load the page from the cache or download it, collecting the chart rows
+            chart_rows, body = self._load_chart_rows(target_date)
             
             # Save the HTML for debugging if needed
-            with open('billboard_debug.html', 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            self.save_debug_html(self.debug_html_filename, body)
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Find all chart rows
-            chart_rows = soup.select('ul.o-chart-results-list-row')
-            print(f"Found {len(chart_rows)} chart rows")
+            logger.info("Found %d chart rows", len(chart_rows))
             
             if not chart_rows:
-                print("No chart rows found. The Billboard Hot 100 page structure might have changed.")
+                logger.warning("No chart rows found. The Billboard Hot 100 page structure might have changed.")
                 return False
             
-            # Extract song information
-            self.tracks_data = []
-            for row in chart_rows:
-                # Find the title within this row
-                title_element = row.select_one('h3.c-title')
-                # Find the artist within this row
-                artist_element = row.select_one('span.c-label.a-no-trucate')
-                
-                if title_element and artist_element:
-                    title = title_element.text.strip()
-                    artist = artist_element.text.strip()
-                    
-                    # Also extract the chart position if available
-                    position_element = row.select_one('span.c-label.a-font-primary-bold-l')
-                    position = position_element.text.strip() if position_element else "N/A"
-                    
-                    self.tracks_data.append((position, title, artist))
+            # Keep the songs whose title and artist were both found
+            self.tracks_data = [entry for entry in chart_rows if entry.title and entry.artist]
             
-            # Print the results
-            print(f"Extracted data for {len(self.tracks_data)} songs")
+            # Report the results
+            logger.info("Extracted data for %d songs", len(self.tracks_data))
             
             # Save the data to a file for reference
             self.save_tracks_to_file(
@@ -92,8 +111,233 @@ class BillboardTop100Scraper(BaseMusicScraper):
             return len(self.tracks_data) > 0
         
         except Exception as e:
-            print(f"Error scraping Billboard Hot 100: {e}")
+            logger.error("Error scraping Billboard Hot 100: %s", e)
+            return False
+    
+    @classmethod
+    def scrape_many_dates(cls, dates, max_workers=SCRAPE_DATES_WORKERS):
+        """
+        Scrape the Billboard Hot 100 charts for several dates in parallel.
+        
+        Each date is scraped by its own scraper in a thread pool, so the
+        downloads overlap instead of waiting on one another. Each date is
+        saved to its usual track list file and page cache, as with scrape(),
+        and its debug dump (if enabled) to billboard_debug_YYYY-MM-DD.html.
+        A date given more than once is only scraped once.
+        
+        Args:
+            dates (iterable): The dates to scrape, in format YYYY-MM-DD.
+            max_workers (int, optional): Number of dates fetched at once.
+                                         Defaults to SCRAPE_DATES_WORKERS.
+            
+        Returns:
+            dict: The tracks data of each date, in the order given; empty for
+                  dates that could not be scraped.
+        """
+        def scrape_date(target_date):
+            scraper = cls()
+            scraper.debug_html_filename = f"billboard_debug_{target_date}.html"
+            if not scraper.scrape(target_date):
+                return []
+            return scraper.get_tracks_data()
+        
+        dates = list(dict.fromkeys(dates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(dates, executor.map(scrape_date, dates)))
+    
+    def _load_chart_rows(self, target_date):
+        """
+        Get the chart rows for a date, from the page cache when possible.
+        
+        Pages of final charts (older than CHART_FINAL_AFTER) are read from
+        CHART_CACHE_DIR if present, and written there after a download. The
+        write goes through a temporary file, so an interrupted one never
+        leaves a truncated page behind; a cached page that can't be read is
+        removed and downloaded again.
+        
+        Args:
+            target_date (str): The chart date in format YYYY-MM-DD.
+            
+        Returns:
+            tuple: The ChartEntry tuples of the chart rows and
+                   the raw page bytes.
+        """
+        cache_path = os.path.join(CHART_CACHE_DIR, f"billboard-{target_date}.html.gz")
+        cacheable = self._is_final_chart(target_date)
+        
+        if cacheable and os.path.exists(cache_path):
+            logger.info("Using cached chart page: %s", cache_path)
+            try:
+                with gzip.open(cache_path, 'rb') as f:
+                    cached = f.read()
+            except (OSError, EOFError) as e:
+                logger.warning("Discarding unreadable cached chart page %s: %s", cache_path, e)
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+            else:
+                return self._parse_chart_rows([cached])
+        
+        # Construct the URL for the specific date
+        url = f"{self.base_url}/{target_date}"
+        logger.info("Fetching data from: %s", url)
+        chart_rows, body = self._fetch_chart_rows(url)
+        
+        if cacheable and chart_rows:
+            self._cache_chart_page(cache_path, body)
+        
+        return chart_rows, body
+    
+    def _cache_chart_page(self, cache_path, body):
+        """
+        Write a chart page to the page cache, gzipped.
+        
+        The page is written to a temporary file in CHART_CACHE_DIR that then
+        replaces the cache file, so readers only ever see a complete page.
+        
+        Args:
+            cache_path (str): The path of the cache file.
+            body (bytes): The raw page.
+        """
+        tmp_path = None
+        try:
+            os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CHART_CACHE_DIR, prefix=".billboard-", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1) as f:
+                f.write(body)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.error("Error caching chart page: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _is_final_chart(self, target_date):
+        """
+        Check whether the chart for a date is old enough that it won't change.
+        
+        Args:
+            target_date (str): The chart date in format YYYY-MM-DD.
+            
+        Returns:
+            bool: True if the chart is final, False otherwise.
+        """
+        try:
+            chart_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+        except ValueError:
             return False
+        return chart_date < date.today() - CHART_FINAL_AFTER
+    
+    def _fetch_chart_rows(self, url):
+        """
+        Stream a chart page from the web into the chart row parser.
+        
+        Args:
+            url (str): The URL of the chart page.
+            
+        Returns:
+            tuple: The ChartEntry tuples of the chart rows and
+                   the raw bytes received.
+        """
+        with self.session.get(url, headers=self.headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            return self._parse_chart_rows(
+                response.iter_content(chunk_size=CHUNK_SIZE), encoding=response_charset(response))
+    
+    def _parse_chart_rows(self, chunks, encoding=None):
+        """
+        Feed a chart page into lxml's incremental parser and collect its rows.
+        
+        Parsing overlaps with the download, and no more chunks are consumed
+        once CHART_SIZE rows have been parsed, skipping the rest of the page.
+        Each row is read as soon as it has been parsed and then dropped from
+        the tree, along with everything parsed before it, so the tree never
+        holds much more than the row being parsed.
+        
+        Args:
+            chunks (iterable): The page content as an iterable of bytes.
+            encoding (str, optional): The page's character set, if known from the
+                                      response headers; otherwise the page's
+                                      <meta charset> is used.
+            
+        Returns:
+            tuple: The ChartEntry tuples of the chart rows and
+                   the raw bytes consumed.
+        """
+        chart_rows = []
+        received = []
+        parser = etree.HTMLPullParser(events=('end',), tag='ul', encoding=encoding)
+        
+        for chunk in chunks:
+            received.append(chunk)
+            parser.feed(chunk)
+            self._read_chart_rows(parser, chart_rows)
+            if len(chart_rows) >= CHART_SIZE:
+                break
+        
+        parser.close()
+        self._read_chart_rows(parser, chart_rows)
+        
+        return chart_rows, b"".join(received)
+    
+    def _read_chart_rows(self, parser, chart_rows):
+        """
+        Read the chart rows the parser has finished since the last call.
+        
+        The position, title and artist of each row are extracted, then the row
+        is cleared and the elements parsed before it are removed, at every
+        level up to the root, so the parsed page doesn't accumulate in memory.
+        
+        Args:
+            parser (etree.HTMLPullParser): The parser the page is being fed into.
+            chart_rows (list): The list to append ChartEntry tuples to.
+        """
+        for _, element in parser.read_events():
+            if not _IS_CHART_ROW(element):
+                continue
+            
+            chart_rows.append(self._extract_row(element))
+            
+            element.clear()
+            node = element
+            while node.getparent() is not None:
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+                node = node.getparent()
+    
+    def _extract_row(self, row):
+        """
+        Extract the position, title and artist of a chart row.
+        
+        The position and artist are interned: the same artists and positions
+        come up again and again, especially across the many charts of a
+        backfill, and interning keeps a single copy of each string.
+        
+        Args:
+            row (etree.Element): The chart row element.
+        
+        Returns:
+            ChartEntry: The position ("N/A" if not found), title and artist; the
+                        title and artist are empty strings if not found.
+        """
+        position = title = artist = None
+        for field in _ROW_FIELDS(row):
+            if field.tag == "h3":
+                if title is None:
+                    title = "".join(field.itertext())
+            elif "a-no-trucate" in field.get("class", "").split():
+                if artist is None:
+                    artist = "".join(field.itertext())
+            elif position is None:
+                position = "".join(field.itertext())
+        
+        return ChartEntry(
+            sys.intern((position or "").strip() or "N/A"),
+            (title or "").strip(),
+            sys.intern((artist or "").strip()),
+        )
     
     def get_chart_date(self):
         """
@@ -1,6 +1,6 @@
-from .base_scraper import BaseMusicScraper
-from bs4 import BeautifulSoup
-import requests
+from .base_scraper import REQUEST_TIMEOUT, BaseMusicScraper, response_charset
+from lxml import etree, html as lxml_html
+import logging
 
 """
 SoundCloud Top EDM Scraper Module
@@ -22,6 +22,15 @@ Example usage:
         tracks_data = techno_scraper.get_tracks_data()
 """
 
+logger = logging.getLogger(__name__)
+
+# Chart lookups, compiled once at import
+_CHART_ITEMS = etree.XPath("//li//article")
+_ITEM_NAME = etree.XPath('.//h2[@itemprop="name"]')
+# The title is the link to the track, the artist the second link in the heading
+_NAME_TITLE_LINK = etree.XPath('.//a[@itemprop="url"]')
+_NAME_ARTIST_LINK = etree.XPath(".//a[2]")
+
 class SoundCloudEDMScraper(BaseMusicScraper):
     """
     Scraper for SoundCloud top EDM chart.
@@ -51,23 +60,28 @@ class SoundCloudEDMScraper(BaseMusicScraper):
         try:
             # Construct the URL for the specific genre
             url = f"{self.base_url}?genre={self.genre}"
-            print(f"Fetching data from: {url}")
+            logger.info("Fetching data from: %s", url)
             
             # Make the request
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
             
             # Parse the HTML
-            soup = BeautifulSoup(response.text, 'lxml')
+            parser = lxml_html.HTMLParser(encoding=response_charset(response))
+            try:
+                tree = lxml_html.fromstring(response.content, parser=parser)
+            except etree.ParserError:
+                # Nothing to parse (e.g. an empty response); no tracks will be found
+                tree = lxml_html.Element("html")
             
             # Find all chart items based on the HTML structure
-            chart_items = soup.select('li article')
-            print(f"Found {len(chart_items)} tracks in the chart")
+            chart_items = _CHART_ITEMS(tree)
+            logger.info("Found %d tracks in the chart", len(chart_items))
             
             if len(chart_items) == 0:
                 # If no tracks found using the selector, save the HTML for debugging
-                with open('soundcloud_debug.html', 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
-                print("No tracks found. HTML saved to 'soundcloud_debug.html' for debugging.")
+                logger.warning("No tracks found.")
+                if not self.save_debug_html('soundcloud_debug.html', response.content):
+                    logger.info("Set MTM_DEBUG_HTML=1 to save the HTML to 'soundcloud_debug.html' for debugging.")
                 return False
             
             # Extract track information
@@ -75,23 +89,23 @@ class SoundCloudEDMScraper(BaseMusicScraper):
             for item in chart_items:
                 try:
                     # Extract title and artist based on the HTML structure
-                    h2_element = item.select_one('h2[itemprop="name"]')
+                    h2_elements = _ITEM_NAME(item)
                     
-                    if h2_element:
+                    if h2_elements:
                         # Title is the text of the first <a> tag
-                        title_element = h2_element.select_one('a[itemprop="url"]')
+                        title_elements = _NAME_TITLE_LINK(h2_elements[0])
                         # Artist is the text of the second <a> tag
-                        artist_element = h2_element.select_one('a:nth-of-type(2)')
+                        artist_elements = _NAME_ARTIST_LINK(h2_elements[0])
                         
-                        if title_element and artist_element:
-                            title = title_element.text.strip()
-                            artist = artist_element.text.strip()
+                        if title_elements and artist_elements:
+                            title = title_elements[0].text_content().strip()
+                            artist = artist_elements[0].text_content().strip()
                             self.tracks_data.append((title, artist))
-                            print(f"Found track: {title} by {artist}")
+                            logger.debug("Found track: %s by %s", title, artist)
                 except Exception as e:
-                    print(f"Error extracting track info: {e}")
+                    logger.warning("Error extracting track info: %s", e)
             
-            print(f"Successfully extracted data for {len(self.tracks_data)} tracks")
+            logger.info("Successfully extracted data for %d tracks", len(self.tracks_data))
             
             # Save the data to a file for reference
             self.save_tracks_to_file(
@@ -102,7 +116,7 @@ class SoundCloudEDMScraper(BaseMusicScraper):
             return len(self.tracks_data) > 0
         
         except Exception as e:
-            print(f"Error scraping SoundCloud: {e}")
+            logger.error("Error scraping SoundCloud: %s", e)
             return False
     
     def get_genre(self):
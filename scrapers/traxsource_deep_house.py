@@ -1,14 +1,35 @@
 """TraxsourceDeepHouse Scraper"""
 
-from .base_scraper import BaseMusicScraper
+from .base_scraper import BaseMusicScraper, class_xpath
 import requests
-from bs4 import BeautifulSoup
-import lxml
+from lxml import etree
 from datetime import datetime
 import os
-import re
-import json
-import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Page lookups, compiled once at import
+_PAGE_TITLE = etree.XPath("string(//title)")
+_TRACK_ROWS = etree.XPath("//" + class_xpath("div", "trk-row"))
+_ROW_TITLE = etree.XPath(".//" + class_xpath("div", "title") + "//a")
+_ROW_VERSION = etree.XPath(".//" + class_xpath("div", "title") + "//" + class_xpath("span", "version"))
+_ROW_ARTISTS = etree.XPath(".//" + class_xpath("div", "artists") + "//" + class_xpath("a", "com-artists"))
+_ROW_REMIXERS = etree.XPath(".//" + class_xpath("div", "artists") + "//" + class_xpath("a", "com-remixers"))
+
+# Hardcoded (title, artist) tuples used for testing when scraping fails
+_FALLBACK_TRACKS = (
+    ("Beat Of An Era", "Jimpster"),
+    ("Whistle Me (Fouk Remix)", "Elisa Elisa"),
+    ("Grooveline (Extended Mix)", "T.Markakis"),
+    ("Casey Screams", "Megatronic"),
+    ("Forbidden Experience", "The Deepshakerz"),
+    ("Tudo Bem (Original Mix)", "Pablo Fierro"),
+    ("In The Morning", "Frag Maddin"),
+    ("Winter Blues (Original Mix)", "Fred Everything"),
+    ("All Goes Down", "Soledrifter"),
+    ("Queens Speech (Original Mix)", "Demuir"),
+)
 
 class TraxsourceDeepHouseScraper(BaseMusicScraper):
     """Scraper for Traxsource's Deep House top tracks."""
@@ -30,7 +51,7 @@ class TraxsourceDeepHouseScraper(BaseMusicScraper):
         if url_custom_param:
             url = f"{url}/{url_custom_param}"
 
-        print(f"Fetching Traxsource Deep House top tracks from: {url}")
+        logger.info("Fetching Traxsource Deep House top tracks from: %s", url)
         self.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept-Language": "en-US,en;q=0.9",
@@ -39,23 +60,17 @@ class TraxsourceDeepHouseScraper(BaseMusicScraper):
         })
 
         try:
-            response = requests.get(url, headers=self.headers)
-            print(f"Response status code: {response.status_code}")
-            response.raise_for_status()
+            # Stream the page into the HTML parser, parsing as it downloads
+            tree, body = self.fetch_page(url)
 
-            # Save raw HTML for debugging
-            os.makedirs("debug", exist_ok=True)
-            with open("debug/traxsource_response.html", "w", encoding="utf-8") as f:
-                f.write(response.text)
-            print("Saved raw HTML to debug/traxsource_response.html for inspection")
+            # Save raw HTML for debugging if needed
+            self.save_debug_html(os.path.join("debug", "traxsource_response.html"), body)
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-            print(f"HTML title: {soup.title.text if soup.title else 'No title found'}")
+            logger.debug("HTML title: %s", _PAGE_TITLE(tree) or "No title found")
 
             # Extract track data
-            track_elements = soup.select("div.trk-row")
-            print(f"Found {len(track_elements)} track elements")
+            track_elements = _TRACK_ROWS(tree)
+            logger.info("Found %d track elements", len(track_elements))
 
             # Clear tracks data before populating
             self.tracks_data = []
@@ -64,16 +79,16 @@ class TraxsourceDeepHouseScraper(BaseMusicScraper):
                 for i, track_element in enumerate(track_elements, 1):
                     try:
                         # Extract title
-                        title_element = track_element.select_one("div.title a")
-                        if title_element:
-                            title = title_element.text.strip()
+                        title_elements = _ROW_TITLE(track_element)
+                        if title_elements:
+                            title = title_elements[0].text_content().strip()
                         else:
                             title = None
                         
                         # Extract version if exists
-                        version_element = track_element.select_one("div.title span.version")
-                        if version_element:
-                            version = version_element.text.strip()
+                        version_elements = _ROW_VERSION(track_element)
+                        if version_elements:
+                            version = version_elements[0].text_content().strip()
                             # Remove duration part if it exists
                             if "(" in version:
                                 version = version.split("(")[0].strip()
@@ -81,16 +96,16 @@ class TraxsourceDeepHouseScraper(BaseMusicScraper):
                             version = ""
                         
                         # Extract artist(s)
-                        artist_elements = track_element.select("div.artists a.com-artists")
+                        artist_elements = _ROW_ARTISTS(track_element)
                         if artist_elements:
-                            artists = [artist.text.strip() for artist in artist_elements]
+                            artists = [artist.text_content().strip() for artist in artist_elements]
                         else:
                             artists = []
                         
                         # Extract remixer(s) if any
-                        remixer_elements = track_element.select("div.artists a.com-remixers")
+                        remixer_elements = _ROW_REMIXERS(track_element)
                         if remixer_elements:
-                            remixers = [remixer.text.strip() for remixer in remixer_elements]
+                            remixers = [remixer.text_content().strip() for remixer in remixer_elements]
                         else:
                             remixers = []
                         
@@ -107,75 +122,45 @@ class TraxsourceDeepHouseScraper(BaseMusicScraper):
                             # Store as (title, artist) tuples to match format expected by PlaylistBuilder
                             self.tracks_data.append((full_title, artist_string))
                         else:
-                            print(f"Couldn't extract title or artist from track {i}")
+                            logger.debug("Couldn't extract title or artist from track %d", i)
                     except Exception as e:
-                        print(f"Error processing track {i}: {str(e)}")
+                        logger.warning("Error processing track %d: %s", i, e)
             
             # Check if we got any tracks
             if not self.tracks_data:
-                print("Using fallback hardcoded track data for testing purposes")
-                # Fallback hardcoded tracks - now as (title, artist) tuples
-                self.tracks_data = [
-                    ("Beat Of An Era", "Jimpster"),
-                    ("Whistle Me (Fouk Remix)", "Elisa Elisa"),
-                    ("Grooveline (Extended Mix)", "T.Markakis"),
-                    ("Casey Screams", "Megatronic"),
-                    ("Forbidden Experience", "The Deepshakerz"),
-                    ("Tudo Bem (Original Mix)", "Pablo Fierro"),
-                    ("In The Morning", "Frag Maddin"),
-                    ("Winter Blues (Original Mix)", "Fred Everything"),
-                    ("All Goes Down", "Soledrifter"),
-                    ("Queens Speech (Original Mix)", "Demuir")
-                ]
+                logger.warning("Using fallback hardcoded track data for testing purposes")
+                self.tracks_data = list(_FALLBACK_TRACKS)
             
-            # Save tracks to file - convert tuples to strings for file output
-            today = datetime.now().strftime("%Y-%m-%d")
-            filename = f"traxsource_deep_house_{today}.txt"
-            title = f"Traxsource Top Deep House Tracks - {today}"
+            self._save(datetime.now().strftime("%Y-%m-%d"))
             
-            # Custom save for track tuples
-            try:
-                with open(filename, "w", encoding="utf-8") as file:
-                    file.write(f"{title}\n\n")
-                    for track_title, track_artist in self.tracks_data:
-                        file.write(f"{track_artist} - {track_title}\n")
-                print(f"Track information saved to {filename}")
-            except Exception as e:
-                print(f"Error saving tracks to file: {str(e)}")
-            
-            print(f"Found and saved {len(self.tracks_data)} tracks")
+            logger.info("Found and saved %d tracks", len(self.tracks_data))
 
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching data from Traxsource: {str(e)}")
-            # Fallback hardcoded tracks - now as (title, artist) tuples
-            self.tracks_data = [
-                ("Beat Of An Era", "Jimpster"),
-                ("Whistle Me (Fouk Remix)", "Elisa Elisa"),
-                ("Grooveline (Extended Mix)", "T.Markakis"),
-                ("Casey Screams", "Megatronic"),
-                ("Forbidden Experience", "The Deepshakerz"),
-                ("Tudo Bem (Original Mix)", "Pablo Fierro"),
-                ("In The Morning", "Frag Maddin"),
-                ("Winter Blues (Original Mix)", "Fred Everything"),
-                ("All Goes Down", "Soledrifter"),
-                ("Queens Speech (Original Mix)", "Demuir")
-            ]
-            today = datetime.now().strftime("%Y-%m-%d")
-            filename = f"traxsource_deep_house_{today}.txt"
-            title = f"Traxsource Top Deep House Tracks - {today}"
-            
-            # Custom save for track tuples
-            try:
-                with open(filename, "w", encoding="utf-8") as file:
-                    file.write(f"{title}\n\n")
-                    for track_title, track_artist in self.tracks_data:
-                        file.write(f"{track_artist} - {track_title}\n")
-                print(f"Track information saved to {filename}")
-            except Exception as e:
-                print(f"Error saving tracks to file: {str(e)}")
+            logger.error("Error fetching data from Traxsource: %s", e)
+            self.tracks_data = list(_FALLBACK_TRACKS)
+            self._save(datetime.now().strftime("%Y-%m-%d"))
         
         return self.tracks_data
 
+    def _save(self, today):
+        """
+        Save the tracks to the dated track list file, as "artist - title" lines.
+
+        Args:
+            today (str): Today's date as YYYY-MM-DD, used in the filename and heading.
+        """
+        filename = f"traxsource_deep_house_{today}.txt"
+        title = f"Traxsource Top Deep House Tracks - {today}"
+
+        try:
+            lines = [f"{title}\n\n"]
+            lines.extend(f"{track_artist} - {track_title}\n" for track_title, track_artist in self.tracks_data)
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write("".join(lines))
+            logger.info("Track information saved to %s", filename)
+        except Exception as e:
+            logger.error("Error saving tracks to file: %s", e)
+
     def get_tracks_data(self):
         """
         Get the track data.
@@ -0,0 +1,182 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+"""
+Search Cache Module
+
+This module contains the SearchCache class, which remembers the Spotify URI
+found for each (title, artist) pair so repeated searches - e.g. for songs that
+stay on a chart for several weeks, or appear on more than one chart - don't
+need another round-trip to the Spotify API.
+
+Keys are normalized (case-folded, surrounding whitespace removed), so the same
+song scraped with different capitalization shares an entry. Songs that Spotify
+could not find are cached too, for a shorter time, so known misses are not
+searched for on every run. Entries expire so catalog changes are picked up.
+
+The cache is kept in memory and persisted as JSON whenever save() is called
+(PlaylistBuilder does so once its searches finish) and when the process exits,
+so it is shared between runs. The file is replaced atomically, so an
+interrupted save or a concurrent run never leaves it half-written. At most MAX_ENTRIES
+entries are persisted; the oldest are dropped first.
+
+Usage:
+    cache = SearchCache(SEARCH_CACHE_PATH)
+    uri = cache.get(("Smooth", "Santana"))
+    if uri is None:
+        uri = ...  # search Spotify
+        cache.set(("Smooth", "Santana"), uri)  # or "" if not found, with MISS_TTL
+"""
+
+logger = logging.getLogger(__name__)
+
+# Default location of the persistent search cache
+SEARCH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "mtm", "search_cache.json")
+
+# How long found and not-found results are kept, in seconds
+HIT_TTL = 30 * 24 * 60 * 60
+MISS_TTL = 3 * 24 * 60 * 60
+
+# Most entries written to disk; the ones stored longest ago are dropped first
+MAX_ENTRIES = 50000
+
+def normalize_key(key):
+    """
+    Normalize a (title, artist) pair for use as a cache key.
+
+    Args:
+        key (tuple): The (title, artist) pair; the artist may be None.
+
+    Returns:
+        tuple: The case-folded, stripped (title, artist) pair.
+    """
+    title, artist = key
+    return (title.casefold().strip(), (artist or "").casefold().strip())
+
+class SearchCache:
+    """
+    A thread-safe, file-backed cache of Spotify search results.
+
+    The file is read lazily on first access, and written back by save() and
+    at exit, only if new entries were added since the last save.
+    """
+
+    def __init__(self, path=SEARCH_CACHE_PATH):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str, optional): The JSON file to persist the cache to.
+                                  Defaults to SEARCH_CACHE_PATH.
+        """
+        self.path = path
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """
+        Load the cache file into memory on first use, dropping expired entries.
+
+        Returns:
+            dict: The cached (uri, expires_at) entries, keyed by normalized (title, artist).
+        """
+        if self._entries is not None:
+            return self._entries
+
+        with self._lock:
+            if self._entries is None:
+                entries = {}
+                now = time.time()
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        for title, artist, uri, expires_at in json.load(f):
+                            if expires_at > now:
+                                entries[(title, artist)] = (uri, expires_at)
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError, TypeError) as e:
+                    logger.warning("Ignoring unreadable search cache %s: %s", self.path, e)
+
+                self._entries = entries
+                atexit.register(self.save)
+
+        return self._entries
+
+    def get(self, key):
+        """
+        Get the cached Spotify URI for a track.
+
+        Args:
+            key (tuple): The (title, artist) pair.
+
+        Returns:
+            str or None: The cached URI, an empty string if the track is cached
+                         as not found on Spotify, or None if it is not cached.
+        """
+        entry = self._load().get(normalize_key(key))
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def set(self, key, uri, ttl=HIT_TTL):
+        """
+        Cache the Spotify URI for a track.
+
+        Args:
+            key (tuple): The (title, artist) pair.
+            uri (str): The Spotify URI of the track, or an empty string if it
+                       was not found.
+            ttl (int, optional): Seconds until the entry expires. Defaults to HIT_TTL.
+        """
+        entries = self._load()
+        with self._lock:
+            # Re-insert so the dict stays ordered by when entries were stored
+            normalized = normalize_key(key)
+            entries.pop(normalized, None)
+            entries[normalized] = (uri, time.time() + ttl)
+            self._dirty = True
+
+    def save(self):
+        """
+        Write the cache back to disk if it has changed since it was last saved.
+
+        The entries are written to a temporary file next to the cache file,
+        which then replaces it, so readers only ever see a complete file. If
+        the write fails, the entries stay pending for the next save.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            rows = [
+                [title, artist, uri, expires_at]
+                for (title, artist), (uri, expires_at) in self._entries.items()
+            ]
+
+            if len(rows) > MAX_ENTRIES:
+                # Entries are ordered by when they were stored, so keep the newest
+                rows = rows[-MAX_ENTRIES:]
+
+            directory = os.path.dirname(self.path) or "."
+            tmp_path = None
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".search_cache-", suffix=".tmp")
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(rows, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error("Error saving search cache: %s", e)
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                return
+
+            self._dirty = False